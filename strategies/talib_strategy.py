@@ -1,3 +1,4 @@
+import logging
 import talib
 import pandas as pd
 import numpy as np
@@ -25,13 +26,14 @@ class AD_Strategy(Strategy):
             logging.error(f"Historical data is invalid for strategy {self.get_strategy_name()}")
             return 0
         
-        # Convert data types to float64 for TA-Lib
-        for col in [df_high, df_low, df_close, df_volume]:
-            historical_data[col] = historical_data[col].astype(np.float64)
-        
+        # Extract float64 arrays for TA-Lib without writing back into the caller's DataFrame
+        high, low, close, volume = (
+            historical_data[col].to_numpy(dtype=np.float64)
+            for col in [df_high, df_low, df_close, df_volume]
+        )
+
         # Calculate Chaikin A/D Line
-        ad_line = talib.AD(historical_data[df_high].values, historical_data[df_low].values, 
-                          historical_data[df_close].values, historical_data[df_volume].values)
+        ad_line = talib.AD(high, low, close, volume)
         
         # Get the last two values to determine trend
         if len(ad_line) < 2: